@@ -13,10 +13,12 @@
 - 模块化架构设计
 
 使用方法:
-    python main.py [--debug]
+    python main.py [--debug] [--no-delay] [--max-delay SECONDS]
 
 参数:
     --debug: 启用调试模式，输出详细日志信息
+    --no-delay: 跳过启动前的随机延时
+    --max-delay: 随机延时的最大秒数（CI环境下不延时）
 """
 
 import sys
@@ -28,11 +30,6 @@ import random
 import time
 from pathlib import Path
 
-# 在 0 ~ 7200 秒之间随机延时（2 小时 = 7200 秒）
-delay = random.randint(0, 360)
-print(f"随机延时 {delay // 60} 分钟后开始执行签到任务...")
-time.sleep(delay)
-
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -50,6 +47,8 @@ def cleanup_handler():
         try:
             print("\n\ud83e\uddf9 正在清理资源...")
             _app_instance._cleanup()
+            # 停止后台日志线程，确保日志全部写入文件
+            _app_instance.logger_manager.shutdown()
             print("✅ 资源清理完成")
         except Exception as e:
             print(f"⚠️ 清理资源时出错: {e}")
@@ -80,6 +79,7 @@ def main():
 示例:
   python main.py              # 正常模式运行
   python main.py --debug      # 调试模式运行
+  python main.py --no-delay   # 跳过随机延时立即执行
 
 配置文件:
   本地运行：程序会自动读取 config.env 配置文件
@@ -97,6 +97,15 @@ def main():
         "--config", default="config.env", help="指定配置文件路径（默认: config.env）"
     )
 
+    parser.add_argument("--no-delay", action="store_true", help="跳过启动前的随机延时")
+
+    parser.add_argument(
+        "--max-delay",
+        type=int,
+        default=360,
+        help="随机延时的最大秒数（默认: 360，CI环境下不延时）",
+    )
+
     args = parser.parse_args()
 
     # 检查配置文件是否存在（仅在本地运行时检查）
@@ -110,6 +119,16 @@ def main():
         print("或者设置环境变量 SITE_USERNAME 和 SITE_PASSWORD")
         return 1
 
+    # 随机延时，错开每次签到时间（CI环境已由调度控制，无需延时）
+    delay = (
+        0
+        if is_ci_environment or args.no_delay
+        else random.randint(0, max(0, args.max_delay))
+    )
+    if delay:
+        print(f"随机延时 {delay // 60} 分 {delay % 60} 秒后开始执行签到任务...")
+        time.sleep(delay)
+
     print("=" * 50)
     print("🤖 98tang-autosign")
     print("=" * 50)
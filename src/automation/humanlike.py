@@ -9,10 +9,55 @@ import logging
 from typing import List, Dict, Optional, Any
 from urllib.parse import urljoin
 
+try:
+    from lxml import html as lxml_html
+
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 from ..browser.helpers import BrowserHelper
 from ..browser.element_finder import ElementFinder
 from ..utils.timing import TimingManager
 
+# 帖子列表中的帖子链接，按优先级排列
+_THREAD_LINK_SELECTORS = (
+    "tbody[id^='normalthread'] a.xst",
+    "a.xst",
+    "th a[href*='thread-']",
+)
+
+# 回复文本框
+_REPLY_SELECTORS = ElementFinder.compile_selectors(
+    (
+        "#fastpostmessage",
+        "textarea[name='message']",
+        "#e_textarea",
+        "textarea[id*='post']",
+        "textarea[class*='reply']",
+    )
+)
+
+# 下一页按钮
+_NEXT_PAGE_SELECTORS = ElementFinder.compile_selectors(
+    (
+        "#fd_page_bottom .pg a.nxt",
+        "#fd_page_top .pg a.nxt",
+        "a.nxt",
+        "a[title*='下一页']",
+        "//a[contains(text(), '下一页')]",
+    )
+)
+
+# 回复提交按钮
+_SUBMIT_SELECTORS = ElementFinder.compile_selectors(
+    (
+        "#fastpostsubmit",
+        "input[name='replysubmit']",
+        "button[type='submit']",
+    )
+)
+
 
 class HumanlikeBehavior:
     """拟人化行为管理器"""
@@ -35,6 +80,9 @@ class HumanlikeBehavior:
         self.reply_messages = config.get("reply_messages", [])
         self.comment_interval = config.get("comment_interval", 15)
 
+        # 复用浏览器登录态的HTTP会话，用于轻量抓取帖子列表（首次使用时创建）
+        self._http_session = None
+
         # 设置评论间隔
         TimingManager.set_comment_interval(self.comment_interval)
 
@@ -46,7 +94,7 @@ class HumanlikeBehavior:
             page_count: 要浏览的页数
         """
         try:
-            self.logger.info(f"开始浏览综合讨论区，共 {page_count} 页")
+            self.logger.info("开始浏览综合讨论区，共 %d 页", page_count)
 
             # 综合讨论区
             section = {
@@ -58,21 +106,21 @@ class HumanlikeBehavior:
             try:
                 # 访问版块首页
                 self.driver.get(section["url"])
-                TimingManager.smart_wait(
-                    TimingManager.PAGE_LOAD_DELAY, 1.0, self.logger
-                )
+                self._wait_loaded()
 
-                self.logger.info(f"计划在 {section['name']} 中浏览 {page_count} 页")
+                self.logger.info("计划在 %s 中浏览 %d 页", section["name"], page_count)
 
                 for page_num in range(page_count):
                     try:
                         current_page = page_num + 1
                         self.logger.info(
-                            f"正在浏览 {section['name']} 第 {current_page} 页"
+                            "正在浏览 %s 第 %d 页", section["name"], current_page
                         )
 
                         # 模拟真实用户的滚动行为
-                        BrowserHelper.human_like_scroll(self.driver, self.logger)
+                        BrowserHelper.batched_human_scroll(
+                            self.driver, logger=self.logger
+                        )
 
                         # 如果不是最后一页，尝试翻页
                         if page_num < page_count - 1:
@@ -82,7 +130,7 @@ class HumanlikeBehavior:
                             success = self._browse_next_page_with_click()
                             if not success:
                                 self.logger.info(
-                                    f"{section['name']} 无法继续翻页，结束浏览"
+                                    "%s 无法继续翻页，结束浏览", section["name"]
                                 )
                                 break
                         else:
@@ -100,111 +148,207 @@ class HumanlikeBehavior:
 
                     except Exception as e:
                         self.logger.warning(
-                            f"浏览 {section['name']} 第 {current_page} 页失败: {e}"
+                            "浏览 %s 第 %d 页失败: %s",
+                            section["name"],
+                            current_page,
+                            e,
                         )
                         break
 
             except Exception as e:
-                self.logger.warning(f"浏览版块 {section['name']} 失败: {e}")
+                self.logger.warning("浏览版块 %s 失败: %s", section["name"], e)
 
             self.logger.info("随机浏览完成")
 
         except Exception as e:
-            self.logger.warning(f"随机浏览失败: {e}")
-
-    def find_reply_targets(self, reply_count: int = 2) -> List[Dict]:
+            self.logger.warning("随机浏览失败: %s", e)
+
+    def find_reply_targets(
+        self,
+        reply_count: int = 2,
+        start_page: int = 2,
+        min_candidates: Optional[int] = None,
+    ) -> List[Dict]:
         """
-        查找回帖目标，从第二页开始查找
+        查找回帖目标，从起始页开始查找，候选帖子足够时不再翻页
 
         Args:
             reply_count: 需要的回帖数量
+            start_page: 起始页码，直接访问该页而不是从第一页翻页
+            min_candidates: 停止翻页所需的候选帖子数，默认为回帖数量的3倍
 
         Returns:
             回帖目标列表
         """
         try:
-            # 先访问第一页
-            discussion_url = f"{self.base_url}/forum.php?mod=forumdisplay&fid=95"
-            self.driver.get(discussion_url)
-            TimingManager.smart_wait(TimingManager.PAGE_LOAD_DELAY, 1.0, self.logger)
-
-            self.logger.info("开始从第二页查找可回复的帖子")
-
-            # 尝试翻页到第二页
-            next_button = self._find_visible_next_page_button()
-            if next_button:
-                self.logger.info("找到下一页按钮，正在翻页到第二页")
-                if self._click_next_page_button(next_button):
-                    self.logger.info("翻页成功")
-                else:
-                    self.logger.debug("翻页失败，尝试直接访问第二页")
-                    page2_url = (
-                        f"{self.base_url}/forum.php?mod=forumdisplay&fid=95&page=2"
+            # 留出去重和随机挑选的余量
+            if min_candidates is None:
+                min_candidates = reply_count * 3
+            unique = {}
+            # 浏览器当前停留的列表页，用于判断能否点击下一页
+            browser_page = None
+
+            self.logger.info("开始从第 %d 页查找可回复的帖子", start_page)
+
+            for page in (start_page, start_page + 1):
+                page_url = self._thread_list_url(page)
+
+                # 优先直接请求列表页并解析，无需浏览器渲染；不可用时回退到浏览器
+                raw_links = self._fetch_thread_links_via_http(page_url)
+                if not raw_links:
+                    raw_links = self._collect_thread_links_via_browser(
+                        page, click_next=browser_page == page - 1
                     )
-                    self.driver.get(page2_url)
-                    TimingManager.smart_wait(
-                        TimingManager.PAGE_LOAD_DELAY, 1.0, self.logger
+                    browser_page = page
+
+                # 收集的同时按URL去重，多页结果合并
+                for link in raw_links:
+                    href = link.get("href")
+                    title = link.get("title")
+                    if not (href and title and len(title) > 4):
+                        continue
+                    # 浏览器返回的href已是绝对地址，只有HTML解析得到的相对地址需要拼接
+                    url = (
+                        href
+                        if href.startswith("http")
+                        else urljoin(self.base_url, href)
                     )
-            else:
-                self.logger.warning("未找到下一页按钮，尝试直接访问第二页")
-                page2_url = f"{self.base_url}/forum.php?mod=forumdisplay&fid=95&page=2"
-                self.driver.get(page2_url)
-                TimingManager.smart_wait(
-                    TimingManager.PAGE_LOAD_DELAY, 1.0, self.logger
-                )
-
-            # 在第二页查找帖子
-            post_links = []
-            selectors = [
-                "tbody[id^='normalthread'] a.xst",
-                "a.xst",
-                "th a[href*='thread-']",
-            ]
-
-            for selector in selectors:
-                try:
-                    from selenium.webdriver.common.by import By
-
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    # 从第二页的前20个帖子中选择
-                    for element in elements[:20]:
-                        href = element.get_attribute("href")
-                        title = element.text.strip()
-
-                        if href and title and len(title) > 4:
-                            post_links.append(
-                                {
-                                    "url": urljoin(self.base_url, href),
-                                    "title": title[:50],
-                                }
-                            )
-
-                    if post_links:
-                        break
-                except Exception:
-                    continue
+                    if url not in unique:
+                        unique[url] = {"url": url, "title": title[:50]}
 
-            # 去重并随机选择
-            unique_posts = []
-            seen_urls = set()
-            for post in post_links:
-                if post["url"] not in seen_urls:
-                    unique_posts.append(post)
-                    seen_urls.add(post["url"])
+                if len(unique) >= min_candidates:
+                    self.logger.debug("第 %d 页候选帖子已足够，无需继续翻页", page)
+                    break
 
+            unique_posts = list(unique.values())
             random.shuffle(unique_posts)
             selected_posts = unique_posts[:reply_count]
 
             self.logger.info(
-                f"从第二页找到 {len(unique_posts)} 个可回复帖子，选择 {len(selected_posts)} 个进行回复"
+                "找到 %d 个可回复帖子，选择 %d 个进行回复",
+                len(unique_posts),
+                len(selected_posts),
             )
 
             return selected_posts
 
         except Exception as e:
-            self.logger.error(f"查找回帖目标失败: {e}")
+            self.logger.error("查找回帖目标失败: %s", e)
             return []
 
+    def _thread_list_url(self, page: int) -> str:
+        """获取综合讨论区指定页的地址"""
+        url = f"{self.base_url}/forum.php?mod=forumdisplay&fid=95"
+        return url if page <= 1 else f"{url}&page={page}"
+
+    def _fetch_thread_links_via_http(self, url: str) -> Optional[List[Dict]]:
+        """
+        通过HTTP请求直接获取帖子列表页的链接
+
+        复用浏览器中的登录Cookie，未登录或解析不可用时返回None
+
+        Args:
+            url: 帖子列表页地址
+
+        Returns:
+            包含href和title的链接列表，失败时返回None
+        """
+        if not LXML_AVAILABLE:
+            return None
+
+        try:
+            cookies = self.driver.get_cookies()
+            # Discuz登录后会下发 *_auth Cookie，没有则视为未登录
+            if not any(c.get("name", "").endswith("_auth") for c in cookies):
+                self.logger.debug("HTTP会话未登录，使用浏览器查找帖子")
+                return None
+
+            if self._http_session is None:
+                # 仅在需要时导入requests，未开启回帖时不产生导入开销
+                import requests
+
+                self._http_session = requests.Session()
+                # 与浏览器保持一致的UA，避免被识别为不同客户端
+                user_agent = self.driver.execute_script("return navigator.userAgent")
+                if user_agent:
+                    self._http_session.headers["User-Agent"] = user_agent
+
+            for cookie in cookies:
+                self._http_session.cookies.set(
+                    cookie["name"], cookie["value"], domain=cookie.get("domain")
+                )
+
+            resp = self._http_session.get(url, timeout=10)
+            resp.raise_for_status()
+            doc = lxml_html.fromstring(resp.content)
+
+            xpaths = [
+                "//tbody[starts-with(@id, 'normalthread')]"
+                "//a[contains(concat(' ', normalize-space(@class), ' '), ' xst ')]",
+                "//a[contains(concat(' ', normalize-space(@class), ' '), ' xst ')]",
+                "//th//a[contains(@href, 'thread-')]",
+            ]
+            for xpath in xpaths:
+                anchors = doc.xpath(xpath)
+                if anchors:
+                    # 从当前页的前20个帖子中选择
+                    return [
+                        {"href": a.get("href"), "title": a.text_content().strip()}
+                        for a in anchors[:20]
+                    ]
+            return []
+
+        except Exception as e:
+            self.logger.debug("HTTP获取帖子列表失败，回退到浏览器: %s", e)
+            return None
+
+    def _collect_thread_links_via_browser(
+        self, page: int, click_next: bool = False
+    ) -> List[Dict]:
+        """
+        通过浏览器打开帖子列表页并获取帖子链接
+
+        Args:
+            page: 列表页页码
+            click_next: 浏览器正停留在上一页时，通过点击下一页翻页，失败时直接访问
+
+        Returns:
+            包含href和title的链接列表
+        """
+        page_url = self._thread_list_url(page)
+
+        if click_next:
+            next_button = self._find_visible_next_page_button()
+            if next_button and self._click_next_page_button(next_button):
+                self.logger.info("翻页成功，当前为第 %d 页", page)
+            else:
+                self.logger.debug("翻页失败，尝试直接访问第 %d 页", page)
+                self.driver.get(page_url)
+                self._wait_loaded()
+        else:
+            self.driver.get(page_url)
+            self._wait_loaded()
+
+        # 合并选择器后一次脚本调用取回链接和标题，避免逐元素往返
+        return (
+            self.driver.execute_script(
+                """
+                const sels = arguments[0];
+                const els = Array.from(document.querySelectorAll(sels.join(', ')));
+                // 只保留优先级最高的选择器命中的元素，避免混入置顶帖
+                const ranks = els.map(e => sels.findIndex(s => e.matches(s)));
+                const best = Math.min(...ranks);
+                // 从当前页的前20个帖子中选择
+                return els
+                    .filter((e, i) => ranks[i] === best)
+                    .slice(0, 20)
+                    .map(e => ({href: e.href, title: (e.textContent || '').trim()}));
+                """,
+                list(_THREAD_LINK_SELECTORS),
+            )
+            or []
+        )
+
     def reply_to_post(self, post_info: Dict) -> bool:
         """
         回复帖子
@@ -216,13 +360,13 @@ class HumanlikeBehavior:
             是否回复成功
         """
         try:
-            self.logger.info(f"回复帖子: {post_info['title']}")
+            self.logger.info("回复帖子: %s", post_info["title"])
 
             self.driver.get(post_info["url"])
-            TimingManager.smart_wait(TimingManager.PAGE_LOAD_DELAY, 1.0, self.logger)
+            self._wait_loaded()
 
             # 模拟用户阅读帖子内容
-            BrowserHelper.human_like_scroll(self.driver, self.logger)
+            BrowserHelper.batched_human_scroll(self.driver, logger=self.logger)
 
             # 智能滚动到回复区域
             reply_textarea = self._smart_scroll_to_reply_area()
@@ -237,14 +381,8 @@ class HumanlikeBehavior:
             TimingManager.smart_wait(TimingManager.NAVIGATION_DELAY, 1.0, self.logger)
 
             # 提交回复
-            submit_selectors = [
-                "#fastpostsubmit",
-                "input[name='replysubmit']",
-                "button[type='submit']",
-            ]
-
             submit_button = self.element_finder.find_clickable_by_selectors(
-                submit_selectors
+                _SUBMIT_SELECTORS
             )
             if submit_button:
                 BrowserHelper.safe_click(self.driver, submit_button, self.logger)
@@ -258,49 +396,12 @@ class HumanlikeBehavior:
                 return False
 
         except Exception as e:
-            self.logger.error(f"回复帖子失败: {e}")
+            self.logger.error("回复帖子失败: %s", e)
             return False
 
     def perform_humanlike_activities(self) -> None:
-        """执行拟人化活动"""
-        try:
-            self.logger.info("开始拟人化活动")
-            TimingManager.adaptive_wait(
-                TimingManager.PAGE_LOAD_DELAY, "normal", self.logger
-            )
-
-            # 随机浏览
-            if self.config.get("enable_random_browsing", False):
-                self.logger.info("执行随机浏览")
-                page_count = self.config.get("browse_page_count", 3)
-                self.random_browse_pages(page_count)
-
-            # 回帖活动
-            if self.config.get("enable_reply", False):
-                reply_count = self.config.get("reply_count", 2)
-                self.logger.info(f"开始回帖活动，目标数量: {reply_count}")
-                post_targets = self.find_reply_targets(reply_count)
-
-                success_count = 0
-                for i, post_info in enumerate(post_targets):
-                    if self.reply_to_post(post_info):
-                        success_count += 1
-
-                    # 两次回帖间隔
-                    if i < len(post_targets) - 1:
-                        wait_time = TimingManager.smart_wait(
-                            TimingManager.REPLY_INTERVAL_DELAY, 1.0, self.logger
-                        )
-                        self.logger.info(
-                            f"回帖间隔等待 {wait_time:.1f} 秒，模拟真实用户行为"
-                        )
-
-                self.logger.info(
-                    f"回帖活动完成，成功 {success_count}/{len(post_targets)} 个"
-                )
-
-        except Exception as e:
-            self.logger.warning(f"拟人化活动失败: {e}")
+        """执行拟人化活动（不关心执行结果时使用）"""
+        self.perform_humanlike_activities_with_results()
 
     def perform_humanlike_activities_with_results(self) -> Dict[str, Any]:
         """执行拟人化活动并返回详细结果"""
@@ -345,6 +446,10 @@ class HumanlikeBehavior:
                         results["reply_success"] = False
                         results["reply_message"] = "未找到可回帖的目标"
                         results["reply_details"] = "没有找到合适的帖子进行回复"
+                    elif not self.reply_messages:
+                        results["reply_success"] = False
+                        results["reply_message"] = "未配置回帖内容"
+                        results["reply_details"] = "REPLY_MESSAGES 为空，无法回帖"
                     else:
                         success_count = 0
                         failed_posts = []
@@ -399,22 +504,28 @@ class HumanlikeBehavior:
 
         return results
 
+    def _wait_loaded(self, max_s: int = 10) -> None:
+        """
+        等待页面DOM就绪，再保留一个短暂的随机停顿
+
+        浏览器使用eager加载策略，这里只依赖DOM（链接文本、回复框），
+        不等待图片等子资源加载完成
+
+        Args:
+            max_s: 等待页面就绪的最长时间（秒）
+        """
+        TimingManager.wait_for_page_ready(
+            self.driver, max_s, self.logger, dom_ready_only=True
+        )
+        TimingManager.smart_wait(TimingManager.CLICK_DELAY, 1.0, self.logger)
+
     def _smart_scroll_to_reply_area(self):
         """智能滚动到回复区域，检测是否到达底部"""
         try:
             self.logger.info("寻找回复文本框")
 
-            # 回复文本框选择器
-            reply_selectors = [
-                "#fastpostmessage",
-                "textarea[name='message']",
-                "#e_textarea",
-                "textarea[id*='post']",
-                "textarea[class*='reply']",
-            ]
-
             # 首先尝试在当前视窗中查找
-            reply_textarea = self.element_finder.find_by_selectors(reply_selectors, 2)
+            reply_textarea = self.element_finder.find_by_selectors(_REPLY_SELECTORS, 2)
             if reply_textarea and reply_textarea.is_displayed():
                 self.logger.info("在当前视窗中找到回复文本框")
                 return reply_textarea
@@ -423,7 +534,7 @@ class HumanlikeBehavior:
             BrowserHelper.scroll_to_bottom(self.driver, self.logger)
 
             # 再次查找
-            reply_textarea = self.element_finder.find_by_selectors(reply_selectors, 3)
+            reply_textarea = self.element_finder.find_by_selectors(_REPLY_SELECTORS, 3)
             if reply_textarea:
                 self.logger.info("在页面底部找到回复文本框")
                 BrowserHelper.scroll_to_element(
@@ -435,43 +546,38 @@ class HumanlikeBehavior:
             return None
 
         except Exception as e:
-            self.logger.warning(f"智能滚动到回复区域失败: {e}")
+            self.logger.warning("智能滚动到回复区域失败: %s", e)
             return None
 
     def _find_visible_next_page_button(self):
         """查找可见的下一页按钮"""
-        next_page_selectors = [
-            "#fd_page_bottom .pg a.nxt",
-            "#fd_page_top .pg a.nxt",
-            "a.nxt",
-            "a[title*='下一页']",
-            "//a[contains(text(), '下一页')]",
-        ]
-
-        return self.element_finder.find_clickable_by_selectors(next_page_selectors, 2)
+        return self.element_finder.find_clickable_by_selectors(_NEXT_PAGE_SELECTORS, 2)
 
     def _click_next_page_button(self, element) -> bool:
         """点击下一页按钮"""
         try:
-            element_text = element.text.strip()
-            href = element.get_attribute("href")
-
-            self.logger.info(f"准备点击下一页按钮: {element_text} - {href}")
+            # 读取按钮文本和链接各需一次浏览器往返，仅在调试时获取
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "准备点击下一页按钮: %s - %s",
+                    element.text.strip(),
+                    element.get_attribute("href"),
+                )
 
             BrowserHelper.safe_click(self.driver, element, self.logger)
-            TimingManager.smart_wait(TimingManager.PAGE_LOAD_DELAY, 1.0, self.logger)
+            self._wait_loaded()
 
             # 验证翻页是否成功
             new_url = self.driver.current_url
             if "page=" in new_url:
-                self.logger.info(f"翻页成功，当前URL: {new_url}")
+                self.logger.info("翻页成功，当前URL: %s", new_url)
                 return True
             else:
                 self.logger.debug("翻页后URL未变化")
                 return False
 
         except Exception as e:
-            self.logger.debug(f"点击下一页按钮失败: {e}")
+            self.logger.debug("点击下一页按钮失败: %s", e)
             return False
 
     def _browse_next_page_with_click(self) -> bool:
@@ -487,5 +593,5 @@ class HumanlikeBehavior:
             return False
 
         except Exception as e:
-            self.logger.debug(f"浏览翻页失败: {e}")
+            self.logger.debug("浏览翻页失败: %s", e)
             return False
@@ -12,6 +12,18 @@ from ..browser.helpers import BrowserHelper
 from ..browser.element_finder import ElementFinder
 from ..utils.timing import TimingManager
 
+# 登录失败时页面中可能出现的错误提示，按优先级排列；预编译的正则用于一次扫描判断是否存在
+_LOGIN_ERROR_INDICATORS = (
+    "用户名或密码错误",
+    "账号已被禁用",
+    "验证码错误",
+    "安全提问答案错误",
+    "登录失败",
+    "请重新登录",
+)
+_LOGIN_ERROR_RE = re.compile("|".join(map(re.escape, _LOGIN_ERROR_INDICATORS)))
+_LOGIN_LOCKOUT_RE = re.compile(r"errorhandle_login\('([^']+)'")
+
 
 class SignInManager:
     """签到管理器"""
@@ -157,11 +169,8 @@ class SignInManager:
 
             # 检查密码错误次数过多的提示
             if "密码错误次数过多" in page_source:
-                import re
-
                 # 提取具体的错误消息
-                error_pattern = r"errorhandle_login\('([^']+)'"
-                match = re.search(error_pattern, page_source)
+                match = _LOGIN_LOCKOUT_RE.search(page_source)
                 if match:
                     error_msg = match.group(1)
                     self.logger.warning(f"检测到账号锁定: {error_msg}")
@@ -169,18 +178,11 @@ class SignInManager:
                 return "密码错误次数过多，账号已被临时锁定"
 
             # 检查其他常见的登录错误消息
-            error_indicators = [
-                "用户名或密码错误",
-                "账号已被禁用",
-                "验证码错误",
-                "安全提问答案错误",
-                "登录失败",
-                "请重新登录",
-            ]
-
-            for error_text in error_indicators:
-                if error_text in page_source:
-                    return error_text
+            if _LOGIN_ERROR_RE.search(page_source):
+                # 存在错误提示时按优先级返回，避免通用提示盖过具体原因
+                for indicator in _LOGIN_ERROR_INDICATORS:
+                    if indicator in page_source:
+                        return indicator
 
             # 检查弹窗中的错误消息
             error_selectors = [
@@ -2,62 +2,213 @@
 浏览器驱动管理模块
 
 负责创建和管理WebDriver实例
+
+环境变量:
+    CHROME_BINARY / GOOGLE_CHROME_SHIM: 指定Chrome可执行文件路径
+    CHROME_USER_DATA_DIR: 持久化用户数据目录（需启用PERSIST_BROWSER_PROFILE）
+    CI_FRESH_PROFILE: 设置后不使用持久化用户数据目录
+    DISABLE_ZYGOTE: 设置后在CI环境中强制添加--no-zygote
+
+/dev/shm剩余空间不足64MB时才添加--disable-dev-shm-usage。
 """
 
+import atexit
 import logging
-from typing import Optional, Dict, Any
+import os
+import queue
+import re
+import shutil
+import subprocess
+from typing import Optional, Dict, Any, Callable, Tuple
+
+# 浏览器自动化依赖在首次创建驱动时由 _lazy_load_uc 导入，
+# 导入本模块本身不再触发undetected_chromedriver的导入链
+uc = None
+webdriver = None
+Options = None
+By = None
+WebDriverWait = None
+EC = None
+TimeoutException = None
+NoSuchElementException = None
+SessionNotCreatedException = None
+WebDriverException = None
+
+# None表示尚未检测
+UNDETECTED_AVAILABLE: Optional[bool] = None
+
+
+def safe_del(self):
+    """安全的析构方法，避免句柄无效错误"""
+    try:
+        if hasattr(self, "_is_patched") and self._is_patched:
+            return  # 已经被安全关闭，不再处理
+    except:
+        pass
+
+
+def _lazy_load_uc() -> bool:
+    """
+    导入浏览器自动化依赖，只在首次调用时执行
+
+    Returns:
+        undetected_chromedriver是否可用
+    """
+    global uc, webdriver, Options, By, WebDriverWait, EC
+    global TimeoutException, NoSuchElementException
+    global SessionNotCreatedException, WebDriverException
+    global UNDETECTED_AVAILABLE
+
+    if UNDETECTED_AVAILABLE is not None:
+        return UNDETECTED_AVAILABLE
+
+    try:
+        import undetected_chromedriver as uc
+    except ImportError:
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+        except ImportError:
+            raise ImportError("请安装selenium: pip install selenium")
+        available = False
+    else:
+        # 修复undetected_chromedriver的__del__方法以防止句柄错误
+        if hasattr(uc.Chrome, "__del__"):
+            uc.Chrome.__del__ = safe_del
+        available = True
 
-# 浏览器自动化导入
-try:
-    import undetected_chromedriver as uc
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.common.exceptions import (
         TimeoutException,
         NoSuchElementException,
+        SessionNotCreatedException,
         WebDriverException,
     )
 
-    # 修复undetected_chromedriver的__del__方法以防止句柄错误
-    def safe_del(self):
-        """安全的析构方法，避免句柄无效错误"""
-        try:
-            if hasattr(self, "_is_patched") and self._is_patched:
-                return  # 已经被安全关闭，不再处理
-        except:
-            pass
-
-    # 应用补丁
-    if hasattr(uc.Chrome, "__del__"):
-        uc.Chrome.__del__ = safe_del
-
-    UNDETECTED_AVAILABLE = True
-except ImportError:
-    try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.service import Service
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.common.exceptions import (
-            TimeoutException,
-            NoSuchElementException,
-            WebDriverException,
-        )
-
-        UNDETECTED_AVAILABLE = False
-    except ImportError:
-        raise ImportError("请安装selenium: pip install selenium")
+    UNDETECTED_AVAILABLE = available
+    return available
+
+
+# 从 "Google Chrome 120.0.6099.109" 之类的输出中提取版本号
+_RE_CHROME_VERSION = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+# chromedriver版本不匹配时的报错信息
+_RE_VERSION_MISMATCH = re.compile(
+    r"supports Chrome version\s*(\d+).*?Current browser version is\s*(\d+)",
+    re.IGNORECASE | re.DOTALL,
+)
+_RE_CURRENT_VERSION = re.compile(r"Current browser version is\s*(\d+)", re.IGNORECASE)
+
+# Github Action 和 CI 环境
+_IS_CI = bool(os.getenv("GITHUB_ACTIONS") or os.getenv("CI"))
+
+_BROWSER_ARGS = (
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "--disable-popup-blocking",
+)
+
+_CI_BROWSER_ARGS = (
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-sync",
+    "--disable-translate",
+    "--hide-scrollbars",
+    "--mute-audio",
+    "--disable-background-networking",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--window-size=1920,1080",
+    # 中文字体支持配置
+    "--font-render-hinting=none",
+    "--disable-font-subpixel-positioning",
+    "--force-device-scale-factor=1",
+)
+
+# 浏览器偏好设置，传给ChromeOptions后不要修改
+_PREFS_LOCAL = {
+    "profile.default_content_setting_values": {"popups": 1},
+    # 中文字体配置
+    "webkit.webprefs.fonts.standard.Hans": "SimSun",
+    "webkit.webprefs.fonts.serif.Hans": "SimSun",
+    "webkit.webprefs.fonts.sansserif.Hans": "SimHei",
+    "webkit.webprefs.fonts.cursive.Hans": "SimSun",
+    "webkit.webprefs.fonts.fantasy.Hans": "SimSun",
+    "webkit.webprefs.fonts.pictograph.Hans": "SimSun",
+    "webkit.webprefs.default_encoding": "UTF-8",
+}
+
+_PREFS_CI = {
+    **_PREFS_LOCAL,
+    "webkit.webprefs.fonts.standard.Hans": "Noto Sans CJK SC",
+    "webkit.webprefs.fonts.serif.Hans": "Noto Serif CJK SC",
+    "webkit.webprefs.fonts.sansserif.Hans": "Noto Sans CJK SC",
+    "webkit.webprefs.fonts.cursive.Hans": "Noto Sans CJK SC",
+    "webkit.webprefs.fonts.fantasy.Hans": "Noto Sans CJK SC",
+    "webkit.webprefs.fonts.pictograph.Hans": "Noto Sans CJK SC",
+}
+
+# 签到流程不需要的图片、字体和媒体资源，通过CDP在网络层拦截
+_BLOCKED_URL_PATTERNS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.mp4",
+    "*.webm",
+    "*.svg",
+)
 
 
 class SafeChrome:
     """安全Chrome驱动包装器"""
 
+    # 高频调用直接绑定到实例，不经过__getattr__
+    _BOUND_METHODS = (
+        "find_element",
+        "find_elements",
+        "execute_script",
+        "get",
+        "switch_to",
+    )
+
     def __init__(self, driver):
         self._driver = driver
         self._is_closed = False
+        # 通过浏览器池复用的次数
+        self._ctx_count = 0
+        for name in self._BOUND_METHODS:
+            setattr(self, name, getattr(driver, name))
+
+    @property
+    def current_url(self) -> str:
+        """当前页面URL"""
+        if self._is_closed:
+            raise RuntimeError("Driver has been closed")
+        return self._driver.current_url
+
+    @property
+    def capabilities(self) -> dict:
+        """浏览器能力信息"""
+        if self._is_closed:
+            raise RuntimeError("Driver has been closed")
+        return self._driver.capabilities
 
     def __getattr__(self, name):
         """代理所有属性访问到原始driver"""
@@ -85,6 +236,9 @@ class SafeChrome:
             finally:
                 self._is_closed = True
                 self._driver = None
+                # 移除绑定的方法，之后的访问回到__getattr__并报告已关闭
+                for name in self._BOUND_METHODS:
+                    self.__dict__.pop(name, None)
 
     def __del__(self):
         """析构函数，防止垃圾回收器错误"""
@@ -92,6 +246,124 @@ class SafeChrome:
         pass
 
 
+class _BrowserPool:
+    """
+    进程级浏览器池
+
+    归还的浏览器清空Cookie并回到空白页后保持空闲，下次创建驱动时直接复用，
+    省去chromedriver启动和uc补丁的开销。默认禁用，只有在同一进程中多次创建
+    驱动时才有意义。池大小和复用上限由浏览器配置中的 browser_pool_size /
+    browser_pool_recycle_after 提供，每次创建驱动时通过 configure 更新。
+    """
+
+    def __init__(self):
+        self.pool_size = 0
+        self.recycle_after = 100
+        self._idle: "queue.Queue[Tuple[str, SafeChrome]]" = queue.Queue()
+
+    def configure(self, pool_size: int, recycle_after: int) -> None:
+        """
+        更新浏览器池配置
+
+        Args:
+            pool_size: 最多保留的空闲浏览器数量，0表示禁用复用
+            recycle_after: 浏览器复用多少次后真正退出
+        """
+        self.pool_size = max(0, pool_size)
+        self.recycle_after = max(1, recycle_after)
+
+    @staticmethod
+    def make_key(config: Dict[str, Any]) -> str:
+        """根据浏览器配置生成池键，不同配置的浏览器不会互相复用"""
+        return repr(sorted(config.items()))
+
+    def checkout(
+        self,
+        key: str,
+        factory: Callable[[], "SafeChrome"],
+        is_alive: Callable[["SafeChrome"], bool],
+    ) -> "SafeChrome":
+        """
+        取出一个空闲浏览器，没有可用的则新建
+
+        Args:
+            key: 池键
+            factory: 新建浏览器的函数
+            is_alive: 检查空闲浏览器是否仍然可用的函数
+
+        Returns:
+            浏览器实例
+        """
+        while True:
+            try:
+                idle_key, driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            # 空闲期间浏览器可能已经崩溃，不可用的直接丢弃
+            if idle_key == key and not driver._is_closed and is_alive(driver):
+                return driver
+            driver.quit()
+
+        return factory()
+
+    def checkin(self, key: str, driver: "SafeChrome") -> bool:
+        """
+        归还浏览器，重置状态后放回池中
+
+        Args:
+            key: 池键
+            driver: 浏览器实例
+
+        Returns:
+            是否放回池中（否则已真正退出）
+        """
+        if driver._is_closed:
+            return False
+
+        driver._ctx_count += 1
+        if (
+            driver._ctx_count >= self.recycle_after
+            or self._idle.qsize() >= self.pool_size
+        ):
+            driver.quit()
+            return False
+
+        try:
+            # 只有多个窗口时才需要逐个关闭，单窗口直接复用
+            handles = driver.window_handles
+            if len(handles) > 1:
+                for handle in handles[1:]:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                driver.switch_to.window(handles[0])
+
+            try:
+                # 清空所有域名的Cookie，delete_all_cookies只作用于当前域名
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception:
+            driver.quit()
+            return False
+
+        self._idle.put((key, driver))
+        return True
+
+    def shutdown(self) -> None:
+        """退出所有空闲浏览器"""
+        while True:
+            try:
+                _, driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            driver.quit()
+
+
+_browser_pool = _BrowserPool()
+atexit.register(_browser_pool.shutdown)
+
+
 class BrowserDriverManager:
     """浏览器驱动管理器"""
 
@@ -105,7 +377,11 @@ class BrowserDriverManager:
         self.logger = logger or logging.getLogger(__name__)
         self.driver: Optional[SafeChrome] = None
         self._is_cleanup_done = False
-        self.wait: Optional[WebDriverWait] = None
+        self.wait: Optional["WebDriverWait"] = None
+        self._pool_key: Optional[str] = None
+
+    # 已探测的Chrome主版本号缓存，键为 (可执行文件路径, 修改时间)
+    _chrome_major_cache: Dict[Tuple[str, float], Optional[int]] = {}
 
     def create_driver(self, config: Dict[str, Any]) -> bool:
         """
@@ -119,111 +395,24 @@ class BrowserDriverManager:
         """
         try:
             self.logger.info("开始创建浏览器驱动")
-
-            headless = config.get("headless", True)
-
-            if UNDETECTED_AVAILABLE:
-                self.logger.info("使用undetected-chromedriver创建浏览器")
-                options = uc.ChromeOptions()
-            
-            else:
-                self.logger.info("使用标准selenium创建浏览器")
-                options = Options() if not UNDETECTED_AVAILABLE else uc.ChromeOptions()
-               
-
-            # 基础配置
-            if headless:
-                options.add_argument("--headless")
-                self.logger.debug("启用无头模式")
-            else:
-                self.logger.debug("使用有头模式（显示浏览器窗口）")
-
-            # 添加浏览器选项
-            browser_args = [
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "--disable-popup-blocking",
-            ]
-
-            # Github Action 和 CI 环境的额外配置
-            import os
-
-            if os.getenv("GITHUB_ACTIONS") or os.getenv("CI"):
-                self.logger.debug("检测到CI环境，添加额外配置")
-                ci_args = [
-                    "--disable-gpu",
-                    "--disable-software-rasterizer",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--disable-features=TranslateUI",
-                    "--disable-ipc-flooding-protection",
-                    "--no-first-run",
-                    "--no-default-browser-check",
-                    "--disable-default-apps",
-                    "--disable-extensions",
-                    "--disable-plugins",
-                    "--disable-sync",
-                    "--disable-translate",
-                    "--hide-scrollbars",
-                    "--mute-audio",
-                    "--no-zygote",
-                    "--disable-background-networking",
-                    "--disable-web-security",
-                    "--allow-running-insecure-content",
-                    "--window-size=1920,1080",
-                    # 中文字体支持配置
-                    "--font-render-hinting=none",
-                    "--disable-font-subpixel-positioning",
-                    "--force-device-scale-factor=1",
-                ]
-                browser_args.extend(ci_args)
-
-            for arg in browser_args:
-                options.add_argument(arg)
-                self.logger.debug(f"添加浏览器参数: {arg}")
-
-            # 配置浏览器偏好设置
-            prefs = {
-                "profile.default_content_setting_values": {"popups": 1},
-                # 中文字体配置
-                "webkit.webprefs.fonts.standard.Hans": "SimSun",
-                "webkit.webprefs.fonts.serif.Hans": "SimSun",
-                "webkit.webprefs.fonts.sansserif.Hans": "SimHei",
-                "webkit.webprefs.fonts.cursive.Hans": "SimSun",
-                "webkit.webprefs.fonts.fantasy.Hans": "SimSun",
-                "webkit.webprefs.fonts.pictograph.Hans": "SimSun",
-                "webkit.webprefs.default_encoding": "UTF-8",
-            }
-
-            # CI环境的额外字体配置
-            if os.getenv("GITHUB_ACTIONS") or os.getenv("CI"):
-                # 在CI环境中，使用系统可能安装的中文字体
-                ci_font_prefs = {
-                    "webkit.webprefs.fonts.standard.Hans": "Noto Sans CJK SC",
-                    "webkit.webprefs.fonts.serif.Hans": "Noto Serif CJK SC",
-                    "webkit.webprefs.fonts.sansserif.Hans": "Noto Sans CJK SC",
-                    "webkit.webprefs.fonts.cursive.Hans": "Noto Sans CJK SC",
-                    "webkit.webprefs.fonts.fantasy.Hans": "Noto Sans CJK SC",
-                    "webkit.webprefs.fonts.pictograph.Hans": "Noto Sans CJK SC",
-                }
-                prefs.update(ci_font_prefs)
-                self.logger.debug("配置CI环境中文字体偏好")
-
-            options.add_experimental_option("prefs", prefs)
-            self.logger.debug("配置浏览器偏好设置: 弹出窗口允许、中文字体支持")
-
-            # 创建驱动
-            self.logger.debug("开始初始化浏览器实例")
-            if UNDETECTED_AVAILABLE:
-                raw_driver = uc.Chrome(options=options)
-            else:
-                raw_driver = webdriver.Chrome(options=options)
-
-            # 使用安全包装器
-            self.driver = SafeChrome(raw_driver)
+            _lazy_load_uc()
+
+            # 优先复用浏览器池中的空闲浏览器
+            _browser_pool.configure(
+                config.get("browser_pool_size", 0),
+                config.get("browser_pool_recycle_after", 100),
+            )
+            self._pool_key = _browser_pool.make_key(config)
+            self.driver = _browser_pool.checkout(
+                self._pool_key,
+                lambda: self._new_driver(config),
+                lambda driver: self._check_alive(driver, deep=True),
+            )
+            self._is_cleanup_done = False
+            if self.driver._ctx_count:
+                self.logger.info(
+                    f"复用浏览器池中的浏览器（已复用 {self.driver._ctx_count} 次）"
+                )
 
             self.wait = WebDriverWait(self.driver, 10)
 
@@ -247,11 +436,318 @@ class BrowserDriverManager:
             self.logger.error(f"创建浏览器驱动失败: {e}")
             return False
 
+    def _new_driver(self, config: Dict[str, Any]) -> SafeChrome:
+        """
+        新建浏览器实例
+
+        Args:
+            config: 浏览器配置
+
+        Returns:
+            包装后的浏览器实例
+        """
+        self.logger.debug("开始初始化浏览器实例")
+        if UNDETECTED_AVAILABLE:
+            self.logger.info("使用undetected-chromedriver创建浏览器")
+            raw_driver = self._init_driver_uc(config)
+        else:
+            self.logger.info("使用标准selenium创建浏览器")
+            raw_driver = webdriver.Chrome(options=self._build_options(config))
+
+        if config.get("block_images", True):
+            self._block_resources(raw_driver)
+
+        # 使用安全包装器
+        return SafeChrome(raw_driver)
+
+    def _block_resources(self, raw_driver) -> None:
+        """
+        通过CDP拦截图片、字体和媒体请求
+
+        Args:
+            raw_driver: 原始Chrome驱动实例
+        """
+        try:
+            raw_driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)}
+            )
+            raw_driver.execute_cdp_cmd("Network.enable", {})
+            self.logger.debug("已通过CDP拦截图片、字体和媒体资源")
+        except Exception as e:
+            self.logger.debug(f"CDP资源拦截设置失败: {e}")
+
+    def _build_options(self, config: Dict[str, Any]):
+        """
+        构建浏览器启动选项
+
+        Args:
+            config: 浏览器配置
+
+        Returns:
+            ChromeOptions实例
+        """
+        headless = config.get("headless", True)
+        options = uc.ChromeOptions() if _lazy_load_uc() else Options()
+
+        # 始终使用版本探测的同一个可执行文件，避免uc自行查找到其他版本的Chrome
+        binary = self._resolve_chrome_binary()
+        if binary:
+            options.binary_location = binary
+
+        # 默认DOM可交互即返回，不等待图片等子资源加载完成
+        options.page_load_strategy = config.get("page_load_strategy", "eager")
+
+        # 基础配置
+        if headless:
+            options.add_argument("--headless")
+            self.logger.debug("启用无头模式")
+        else:
+            self.logger.debug("使用有头模式（显示浏览器窗口）")
+
+        # 添加浏览器选项
+        browser_args = list(_BROWSER_ARGS)
+
+        # Github Action 和 CI 环境的额外配置
+        if _IS_CI:
+            self.logger.debug("检测到CI环境，添加额外配置")
+            browser_args.extend(_CI_BROWSER_ARGS)
+
+            # 只有内核不支持用户命名空间时zygote才会失效
+            if os.getenv("DISABLE_ZYGOTE") or not os.path.exists("/proc/self/ns/user"):
+                browser_args.append("--no-zygote")
+
+        # /dev/shm空间足够时保留共享内存，不足时才回退到/tmp
+        if not self._shm_usable():
+            browser_args.append("--disable-dev-shm-usage")
+
+        # 固定用户数据目录，跨运行复用磁盘缓存，避免每次重新下载站点静态资源
+        if config.get("persist_profile", False) and not os.getenv("CI_FRESH_PROFILE"):
+            profile_dir = self._prepare_profile_dir()
+            if profile_dir:
+                browser_args.append(f"--user-data-dir={profile_dir}")
+                browser_args.append("--disk-cache-size=104857600")
+                self.logger.debug(f"使用持久化用户数据目录: {profile_dir}")
+
+        # 禁止加载图片，减少流量和渲染开销
+        block_images = config.get("block_images", True)
+        if block_images:
+            browser_args.append("--blink-settings=imagesEnabled=false")
+
+        # ChromeOptions.arguments是普通列表，直接批量追加
+        options.arguments.extend(browser_args)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("添加浏览器参数: %s", browser_args)
+
+        # 配置浏览器偏好设置，CI环境使用系统可能安装的中文字体
+        prefs = _PREFS_CI if _IS_CI else _PREFS_LOCAL
+        if block_images:
+            prefs = {**prefs, "profile.managed_default_content_settings.images": 2}
+
+        options.add_experimental_option("prefs", prefs)
+        self.logger.debug("配置浏览器偏好设置: 弹出窗口允许、中文字体支持")
+
+        return options
+
+    def _prepare_profile_dir(self) -> Optional[str]:
+        """
+        准备持久化用户数据目录
+
+        目录只对当前用户开放；启动前删除Cookie存储，保证每次运行都从未登录状态开始，
+        只复用HTTP缓存。
+
+        Returns:
+            目录路径，目录被其他Chrome进程占用或无法创建时返回None
+        """
+        profile_dir = os.getenv("CHROME_USER_DATA_DIR") or os.path.join(
+            os.getenv("XDG_CACHE_HOME")
+            or os.path.join(os.path.expanduser("~"), ".cache"),
+            "98tang-autosign",
+            "chrome-profile",
+        )
+        try:
+            os.makedirs(profile_dir, mode=0o700, exist_ok=True)
+            os.chmod(profile_dir, 0o700)
+        except OSError as e:
+            self.logger.warning(f"无法创建用户数据目录，使用临时配置: {e}")
+            return None
+
+        if self._profile_in_use(profile_dir):
+            self.logger.warning(
+                f"用户数据目录正被其他Chrome进程使用，使用临时配置: {profile_dir}"
+            )
+            return None
+
+        for name in (
+            os.path.join("Default", "Cookies"),
+            os.path.join("Default", "Cookies-journal"),
+            os.path.join("Default", "Network", "Cookies"),
+            os.path.join("Default", "Network", "Cookies-journal"),
+        ):
+            try:
+                os.remove(os.path.join(profile_dir, name))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(f"删除Cookie存储失败，使用临时配置: {e}")
+                return None
+
+        return profile_dir
+
+    @staticmethod
+    def _profile_in_use(profile_dir: str) -> bool:
+        """
+        检查用户数据目录的SingletonLock是否由仍在运行的Chrome持有
+
+        Args:
+            profile_dir: 用户数据目录
+
+        Returns:
+            是否被占用
+        """
+        lock = os.path.join(profile_dir, "SingletonLock")
+        # Windows上没有该符号链接，且os.kill会直接结束进程
+        if os.name == "nt" or not os.path.islink(lock):
+            return False
+
+        try:
+            # 链接目标形如 "hostname-12345"
+            pid = int(os.readlink(lock).rsplit("-", 1)[-1])
+            os.kill(pid, 0)
+        except PermissionError:
+            return True  # 进程存在但属于其他用户
+        except (OSError, ValueError):
+            return False  # 残留的锁，Chrome启动时会自行清理
+        return True
+
+    @staticmethod
+    def _shm_usable(min_free: int = 64 * 1024 * 1024) -> bool:
+        """
+        检查/dev/shm是否有足够的剩余空间
+
+        Args:
+            min_free: 最小剩余字节数
+
+        Returns:
+            /dev/shm是否可用
+        """
+        try:
+            return shutil.disk_usage("/dev/shm").free >= min_free
+        except OSError:
+            return False
+
+    def _init_driver_uc(self, config: Dict[str, Any]):
+        """
+        使用undetected-chromedriver启动浏览器
+
+        预先探测Chrome主版本号并传给uc，避免下载不匹配的驱动后启动失败再重试
+
+        Args:
+            config: 浏览器配置
+
+        Returns:
+            原始Chrome驱动实例
+        """
+        binary = self._resolve_chrome_binary()
+        version_main = self._detect_chrome_major(binary)
+        if version_main:
+            self.logger.debug(f"检测到Chrome主版本: {version_main} ({binary})")
+
+        try:
+            return uc.Chrome(
+                options=self._build_options(config), version_main=version_main
+            )
+        except SessionNotCreatedException as e:
+            # 未能预先探测版本时，从报错信息中解析实际浏览器版本后重试
+            if version_main is not None:
+                raise
+            msg = str(e)
+            mismatch = _RE_VERSION_MISMATCH.search(msg)
+            if mismatch:
+                version_main = int(mismatch.group(2))
+                self.logger.warning(
+                    f"驱动支持版本 {mismatch.group(1)} 与浏览器版本不匹配，"
+                    f"使用版本 {version_main} 重试"
+                )
+            else:
+                match = _RE_CURRENT_VERSION.search(msg)
+                if not match:
+                    raise
+                version_main = int(match.group(1))
+                self.logger.warning(
+                    f"驱动与浏览器版本不匹配，使用版本 {version_main} 重试"
+                )
+            # ChromeOptions不能重复使用，需要重新构建
+            return uc.Chrome(
+                options=self._build_options(config), version_main=version_main
+            )
+
+    @staticmethod
+    def _resolve_chrome_binary() -> Optional[str]:
+        """
+        查找Chrome可执行文件路径
+
+        优先使用 CHROME_BINARY / GOOGLE_CHROME_SHIM 环境变量，其次在PATH中查找
+
+        Returns:
+            可执行文件路径，未找到时返回None
+        """
+        for env_name in ("CHROME_BINARY", "GOOGLE_CHROME_SHIM"):
+            path = os.getenv(env_name)
+            if path and os.path.exists(path):
+                return path
+
+        for name in (
+            "google-chrome",
+            "google-chrome-stable",
+            "chromium",
+            "chromium-browser",
+            "chrome",
+        ):
+            path = shutil.which(name)
+            if path:
+                return path
+        return None
+
+    @classmethod
+    def _detect_chrome_major(cls, binary: Optional[str]) -> Optional[int]:
+        """
+        通过 `<binary> --version` 探测Chrome主版本号，结果按路径和修改时间缓存
+
+        Args:
+            binary: Chrome可执行文件路径
+
+        Returns:
+            主版本号，无法探测时返回None
+        """
+        # Windows上的chrome.exe不支持 --version 输出，会直接打开浏览器
+        if not binary or os.name == "nt":
+            return None
+
+        try:
+            cache_key = (binary, os.path.getmtime(binary))
+        except OSError:
+            return None
+
+        if cache_key not in cls._chrome_major_cache:
+            major = None
+            try:
+                result = subprocess.run(
+                    [binary, "--version"], capture_output=True, text=True, timeout=3
+                )
+                match = _RE_CHROME_VERSION.search(result.stdout)
+                if match:
+                    major = int(match.group(1))
+            except (OSError, subprocess.SubprocessError):
+                pass
+            cls._chrome_major_cache[cache_key] = major
+
+        return cls._chrome_major_cache[cache_key]
+
     def get_driver(self):
         """获取WebDriver实例"""
         return self.driver
 
-    def get_wait(self) -> Optional[WebDriverWait]:
+    def get_wait(self) -> Optional["WebDriverWait"]:
         """获取WebDriverWait实例"""
         return self.wait
 
@@ -259,15 +755,11 @@ class BrowserDriverManager:
         """关闭浏览器驱动"""
         if self.driver and not self._is_cleanup_done:
             try:
-                # 先尝试关闭所有窗口
-                try:
-                    self.driver.close()
-                except Exception:
-                    pass  # 忽略关闭窗口的错误
-
-                # 然后退出驱动
-                self.driver.quit()
-                self.logger.info("浏览器已关闭")
+                # 归还到浏览器池，池已满或达到复用上限时真正退出
+                if _browser_pool.checkin(self._pool_key, self.driver):
+                    self.logger.info("浏览器已重置并归还到浏览器池")
+                else:
+                    self.logger.info("浏览器已关闭")
             except Exception as e:
                 self.logger.warning(f"关闭浏览器失败: {e}")
             finally:
@@ -280,20 +772,16 @@ class BrowserDriverManager:
         """强制关闭浏览器驱动（用于异常情况）"""
         if self.driver and not self._is_cleanup_done:
             try:
-                import os
-                import signal
-
                 # 尝试获取Chrome进程ID并强制结束
                 try:
-                    if hasattr(self.driver, "_driver") and hasattr(
-                        self.driver._driver, "service"
-                    ):
-                        service = self.driver._driver.service
-                        if hasattr(service, "process"):
-                            process = service.process
-                            if process and process.poll() is None:
-                                process.terminate()
-                                process.wait(timeout=3)
+                    raw = self.driver._driver
+                    service = getattr(raw, "service", None)
+                    process = getattr(service, "process", None)
+                    if process is not None and process.poll() is not None:
+                        process = None
+                    # uc以独立进程启动Chrome，它不是chromedriver的子进程
+                    browser_pid = getattr(raw, "browser_pid", None)
+                    self._kill_process_tree(process, browser_pid)
                 except Exception:
                     pass
 
@@ -307,14 +795,98 @@ class BrowserDriverManager:
                 self.driver = None
                 self.wait = None
 
-    def is_driver_alive(self) -> bool:
-        """检查驱动是否仍然活跃"""
+    def _kill_process_tree(
+        self,
+        process: Optional[subprocess.Popen],
+        browser_pid: Optional[int] = None,
+    ) -> None:
+        """
+        结束chromedriver进程及Chrome进程树
+
+        chromedriver先发送SIGTERM，0.5秒内未退出则升级为SIGKILL。
+
+        Args:
+            process: 仍在运行的chromedriver服务进程
+            browser_pid: uc单独启动的Chrome主进程ID
+        """
+        # 父进程退出后子进程会被重新挂到init下，必须先记录
+        leftovers = []
+        try:
+            import psutil
+        except ImportError:
+            self.logger.debug("psutil不可用，跳过清理Chrome子进程")
+        else:
+            roots = []
+            if process is not None:
+                roots.append((process.pid, False))
+            if browser_pid:
+                roots.append((browser_pid, True))
+            for pid, include_root in roots:
+                try:
+                    root = psutil.Process(pid)
+                    leftovers.extend(root.children(recursive=True))
+                    if include_root:
+                        leftovers.append(root)
+                except Exception as e:
+                    self.logger.debug(f"获取Chrome子进程失败: {e}")
+
+        try:
+            if process is not None:
+                process.terminate()
+                try:
+                    process.wait(timeout=0.5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    try:
+                        process.wait(timeout=1)
+                    except subprocess.TimeoutExpired:
+                        self.logger.debug("chromedriver进程在SIGKILL后仍未退出")
+        finally:
+            # 无论chromedriver是否正常退出，都要清理Chrome进程树
+            for proc in leftovers:
+                try:
+                    proc.kill()
+                except Exception:
+                    pass  # 进程可能已经退出
+
+    def is_driver_alive(self, deep: bool = False) -> bool:
+        """
+        检查驱动是否仍然活跃
+
+        Args:
+            deep: 是否通过获取当前URL确认浏览器仍能响应，默认只检查本地状态
+
+        Returns:
+            驱动是否活跃
+        """
         if not self.driver:
             return False
+        return self._check_alive(self.driver, deep)
+
+    @staticmethod
+    def _check_alive(driver: SafeChrome, deep: bool = False) -> bool:
+        """
+        检查指定浏览器是否仍然活跃
 
+        Args:
+            driver: 浏览器实例
+            deep: 是否通过获取当前URL确认浏览器仍能响应
+
+        Returns:
+            浏览器是否活跃
+        """
         try:
-            # 尝试获取当前URL来检查驱动是否仍然活跃
-            self.driver.current_url
-            return True
+            if deep:
+                # 尝试获取当前URL来检查驱动是否仍然活跃
+                driver.current_url
+                return True
+
+            # 只检查会话ID和chromedriver进程，不发起WebDriver请求
+            raw = driver._driver
+            if raw is None or not getattr(raw, "session_id", None):
+                return False
+            service = getattr(raw, "service", None)
+            process = getattr(service, "process", None)
+            return process is None or process.poll() is None
         except Exception:
             return False
@@ -5,13 +5,16 @@
 """
 
 import logging
-from typing import List, Optional
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+# 定位器：(By.XPATH, "//...") 或 (By.CSS_SELECTOR, "...")
+Locator = Tuple[str, str]
+
 
 class ElementFinder:
     """元素查找器"""
@@ -27,12 +30,41 @@ class ElementFinder:
         self.driver = driver
         self.logger = logger or logging.getLogger(__name__)
 
-    def find_by_selectors(self, selectors: List[str], timeout: int = 5) -> Optional:
+    @staticmethod
+    def compile_selectors(selectors: Iterable[str]) -> Tuple[Locator, ...]:
         """
-        通过多个选择器查找元素
+        将选择器字符串预先转换为定位器元组
+
+        以 // 开头的视为XPath，其余视为CSS选择器
 
         Args:
             selectors: 选择器列表
+
+        Returns:
+            定位器元组
+        """
+        return tuple(
+            (By.XPATH, s) if s.startswith("//") else (By.CSS_SELECTOR, s)
+            for s in selectors
+        )
+
+    @staticmethod
+    def _to_locator(selector: Union[str, Locator]) -> Locator:
+        """将单个选择器转换为定位器，已是定位器时原样返回"""
+        if isinstance(selector, tuple):
+            return selector
+        if selector.startswith("//"):
+            return (By.XPATH, selector)
+        return (By.CSS_SELECTOR, selector)
+
+    def find_by_selectors(
+        self, selectors: Sequence[Union[str, Locator]], timeout: int = 5
+    ) -> Optional:
+        """
+        通过多个选择器查找元素
+
+        Args:
+            selectors: 选择器列表，也可以是预编译的定位器元组
             timeout: 超时时间
 
         Returns:
@@ -40,14 +72,9 @@ class ElementFinder:
         """
         for selector in selectors:
             try:
-                if selector.startswith("//"):
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.XPATH, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
+                element = WebDriverWait(self.driver, timeout).until(
+                    EC.presence_of_element_located(self._to_locator(selector))
+                )
 
                 if element and element.is_displayed():
                     self.logger.debug(f"找到元素: {selector}")
@@ -60,13 +87,13 @@ class ElementFinder:
         return None
 
     def find_clickable_by_selectors(
-        self, selectors: List[str], timeout: int = 5
+        self, selectors: Sequence[Union[str, Locator]], timeout: int = 5
     ) -> Optional:
         """
         通过多个选择器查找可点击元素
 
         Args:
-            selectors: 选择器列表
+            selectors: 选择器列表，也可以是预编译的定位器元组
             timeout: 超时时间
 
         Returns:
@@ -74,14 +101,9 @@ class ElementFinder:
         """
         for selector in selectors:
             try:
-                if selector.startswith("//"):
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.XPATH, selector))
-                    )
-                else:
-                    element = WebDriverWait(self.driver, timeout).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
+                element = WebDriverWait(self.driver, timeout).until(
+                    EC.element_to_be_clickable(self._to_locator(selector))
+                )
 
                 self.logger.debug(f"找到可点击元素: {selector}")
                 return element
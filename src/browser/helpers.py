@@ -228,6 +228,55 @@ class BrowserHelper:
             # 回退到简单滚动
             BrowserHelper.random_scroll(driver, logger)
 
+    @staticmethod
+    def batched_human_scroll(
+        driver, steps: int = 5, logger: Optional[logging.Logger] = None
+    ) -> None:
+        """
+        批量人性化滚动，在浏览器内一次性执行整段滚动计划
+
+        滚动距离和停顿在Python中随机生成，整个滚动过程只需一次脚本调用
+
+        Args:
+            driver: WebDriver实例
+            steps: 滚动次数
+            logger: 日志器
+        """
+        try:
+            offsets = [random.randint(200, 500) for _ in range(steps)]
+            waits = [random.uniform(0.3, 0.9) for _ in range(steps)]
+
+            scrolled = driver.execute_async_script(
+                """
+                const offsets = arguments[0];
+                const waits = arguments[1];
+                const done = arguments[arguments.length - 1];
+                let i = 0;
+                function step() {
+                    const atBottom = (window.innerHeight + window.pageYOffset)
+                        >= document.body.scrollHeight - 10;
+                    if (i >= offsets.length || atBottom) {
+                        done(i);
+                        return;
+                    }
+                    window.scrollBy({top: offsets[i], behavior: 'smooth'});
+                    setTimeout(step, waits[i++] * 1000);
+                }
+                step();
+                """,
+                offsets,
+                waits,
+            )
+
+            if logger:
+                logger.debug(f"批量滚动完成，共滚动 {scrolled} 次")
+
+        except Exception as e:
+            if logger:
+                logger.warning(f"批量滚动失败: {e}")
+            # 回退到简单滚动
+            BrowserHelper.random_scroll(driver, logger)
+
     @staticmethod
     def scroll_to_element(
         driver, element, logger: Optional[logging.Logger] = None
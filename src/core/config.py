@@ -44,6 +44,29 @@ class ConfigManager:
             }
         )
 
+        # 浏览器配置
+        self._config.update(
+            {
+                "persist_profile": os.getenv("PERSIST_BROWSER_PROFILE", "false").lower()
+                == "true",
+            }
+        )
+
+        # 浏览器池默认禁用，只有同一进程多次创建驱动时才有意义
+        self._config.update(
+            {
+                "browser_pool_size": max(0, self._get_int_env("BROWSER_POOL_SIZE", 0)),
+                "browser_pool_recycle_after": max(
+                    1, self._get_int_env("BROWSER_POOL_RECYCLE_AFTER", 100)
+                ),
+            }
+        )
+
+        page_load_strategy = os.getenv("PAGE_LOAD_STRATEGY", "eager").strip().lower()
+        if page_load_strategy not in ("normal", "eager", "none"):
+            page_load_strategy = "eager"
+        self._config["page_load_strategy"] = page_load_strategy
+
         # 日志配置
         self._config.update(
             {
@@ -135,6 +158,14 @@ class ConfigManager:
             }
         )
 
+        # 拦截图片等资源默认启用；发送截图时默认关闭，避免截图中缺少图片
+        block_images_default = (
+            "false" if self._config["TELEGRAM_SEND_SCREENSHOT"] else "true"
+        )
+        self._config["block_images"] = (
+            os.getenv("BLOCK_IMAGES", "").strip() or block_images_default
+        ).lower() == "true"
+
         # 拟人化活动总开关
         self._config["enable_humanlike"] = (
             self._config["enable_reply"] or self._config["enable_random_browsing"]
@@ -154,6 +185,27 @@ class ConfigManager:
         # 验证必要配置
         self._validate_config()
 
+    @staticmethod
+    def _get_int_env(name: str, default: int) -> int:
+        """
+        读取整数环境变量，格式无效时使用默认值
+
+        Args:
+            name: 环境变量名
+            default: 默认值
+
+        Returns:
+            整数配置值
+        """
+        value = os.getenv(name, "").strip()
+        if not value:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            print(f"配置警告：{name}={value!r} 不是有效整数，使用默认值 {default}")
+            return default
+
     def _validate_config(self) -> None:
         """验证配置的有效性"""
         if not self._config["username"] or not self._config["password"]:
@@ -260,6 +312,11 @@ class ConfigManager:
         return {
             "headless": self._config["headless"],
             "base_url": self._config["base_url"],
+            "persist_profile": self._config["persist_profile"],
+            "block_images": self._config["block_images"],
+            "page_load_strategy": self._config["page_load_strategy"],
+            "browser_pool_size": self._config["browser_pool_size"],
+            "browser_pool_recycle_after": self._config["browser_pool_recycle_after"],
         }
 
     def get_auth_config(self) -> Dict[str, Any]:
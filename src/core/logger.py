@@ -4,9 +4,13 @@
 统一的日志配置和管理
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
+import threading
 import glob
 from datetime import datetime
 from typing import Optional
@@ -18,6 +22,11 @@ class LoggerManager:
     _instance: Optional["LoggerManager"] = None
     _logger: Optional[logging.Logger] = None
     _current_log_file: Optional[str] = None
+    _listener: Optional[logging.handlers.QueueListener] = None
+    _queue_handler: Optional[logging.handlers.QueueHandler] = None
+    _file_handler: Optional[logging.Handler] = None
+    # flush/shutdown可能同时在主线程和超时保护线程中调用
+    _listener_lock = threading.Lock()
 
     def __new__(cls) -> "LoggerManager":
         """单例模式"""
@@ -100,7 +109,15 @@ class LoggerManager:
         # 文件处理器 - 添加编码错误处理，确保在CI环境中的兼容性
         file_handler = logging.FileHandler(log_file, encoding="utf-8", errors="replace")
         file_handler.setFormatter(formatter)
-        self._logger.addHandler(file_handler)
+
+        # 文件写入交给后台线程，日志调用立即返回，不阻塞浏览器操作
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        self._queue_handler = logging.handlers.QueueHandler(log_queue)
+        self._file_handler = file_handler
+        self._logger.addHandler(self._queue_handler)
+        self._listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._listener.start()
+        atexit.register(self.shutdown)
 
         self._logger.setLevel(log_level_obj)
 
@@ -117,9 +134,30 @@ class LoggerManager:
         return self._logger
 
     def get_current_log_file(self) -> Optional[str]:
-        """获取当前日志文件路径"""
+        """获取当前日志文件路径，返回前确保已排队的日志写入文件"""
+        self.flush()
         return self._current_log_file
 
+    def flush(self) -> None:
+        """等待队列中的日志全部写入文件"""
+        with self._listener_lock:
+            if self._listener is not None:
+                # stop会处理完队列中剩余的日志后再返回
+                self._listener.stop()
+                self._listener.start()
+
+    def shutdown(self) -> None:
+        """停止后台日志线程，之后的日志直接同步写入文件"""
+        with self._listener_lock:
+            if self._listener is None:
+                return
+
+            self._listener.stop()
+            self._listener = None
+            if self._logger is not None:
+                self._logger.removeHandler(self._queue_handler)
+                self._logger.addHandler(self._file_handler)
+
     def _cleanup_old_logs(self, log_dir: str, max_files: int) -> None:
         """
         清理旧日志文件
@@ -7,11 +7,22 @@ Telegram Bot 通知模块
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import os
 from datetime import datetime
 from typing import Optional, Dict, Any, List, Union
 from dataclasses import dataclass, asdict
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Telegram API响应体读取上限，正常响应远小于此值
+_MAX_RESPONSE_BYTES = 64 * 1024
+
 
 @dataclass
 class TaskResult:
@@ -143,6 +154,10 @@ class TelegramNotifier:
 
         self.api_url = f"{self.proxy_url}/bot{self.bot_token}"
 
+        # 复用连接，批量发送消息和附件时避免重复TCP/TLS握手
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
         # 验证配置
         self._validate_config()
 
@@ -155,6 +170,64 @@ class TelegramNotifier:
 
         self.logger.debug(f"Telegram通知器初始化完成，使用API: {self.proxy_url}")
 
+    @staticmethod
+    def _read_body(response: requests.Response) -> bytes:
+        """
+        读取流式响应体，超过上限时中止
+
+        读取后关闭响应，使连接归还连接池
+
+        Args:
+            response: 以stream=True发起请求得到的HTTP响应
+
+        Returns:
+            响应体字节
+        """
+        try:
+            body = response.raw.read(_MAX_RESPONSE_BYTES + 1, decode_content=True)
+        finally:
+            response.close()
+
+        if len(body) > _MAX_RESPONSE_BYTES:
+            raise ValueError(f"Telegram API响应过大，超过 {_MAX_RESPONSE_BYTES} 字节")
+        return body
+
+    def _log_error_body(self, response: requests.Response) -> None:
+        """
+        在DEBUG级别记录错误响应内容，未开启DEBUG时直接关闭响应
+
+        Args:
+            response: 以stream=True发起请求得到的HTTP响应
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            response.close()
+            return
+
+        try:
+            body = self._read_body(response)
+        except ValueError as e:
+            self.logger.debug("响应内容未记录: %s", e)
+            return
+        self.logger.debug("响应内容: %s", body.decode("utf-8", "replace"))
+
+    @classmethod
+    def _parse_response(cls, response: requests.Response) -> Dict[str, Any]:
+        """
+        解析Telegram API响应
+
+        直接解析原始字节，跳过requests的编码探测；安装了orjson时优先使用
+
+        Args:
+            response: HTTP响应
+
+        Returns:
+            解析后的响应字典
+        """
+        body = cls._read_body(response)
+        if ORJSON_AVAILABLE:
+            return orjson.loads(body)
+        return json.loads(body)
+
     def send_message(self, message: str, parse_mode: str = "MarkdownV2") -> bool:
         """
         发送消息到Telegram
@@ -176,10 +249,10 @@ class TelegramNotifier:
 
             self.logger.debug(f"发送Telegram消息: {message[:100]}...")
 
-            response = requests.post(url, json=payload, timeout=30)
+            response = self._session.post(url, json=payload, timeout=30, stream=True)
 
             if response.status_code == 200:
-                result = response.json()
+                result = self._parse_response(response)
                 if result.get("ok"):
                     self.logger.debug("Telegram消息发送成功")
                     return True
@@ -192,7 +265,7 @@ class TelegramNotifier:
                 self.logger.error(
                     f"Telegram消息发送失败，HTTP状态码: {response.status_code}"
                 )
-                self.logger.debug(f"响应内容: {response.text}")
+                self._log_error_body(response)
                 return False
 
         except requests.exceptions.Timeout:
@@ -244,10 +317,12 @@ class TelegramNotifier:
 
                 self.logger.debug(f"发送日志文件: {log_file_path}")
 
-                response = requests.post(url, files=files, data=data, timeout=60)
+                response = self._session.post(
+                    url, files=files, data=data, timeout=60, stream=True
+                )
 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = self._parse_response(response)
                     if result.get("ok"):
                         self.logger.debug("日志文件发送成功")
                         return True
@@ -260,7 +335,7 @@ class TelegramNotifier:
                     self.logger.error(
                         f"日志文件发送失败，HTTP状态码: {response.status_code}"
                     )
-                    self.logger.debug(f"响应内容: {response.text}")
+                    self._log_error_body(response)
                     return False
 
         except requests.exceptions.Timeout:
@@ -348,10 +423,12 @@ class TelegramNotifier:
 
                 self.logger.debug(f"发送文档: {document_path}")
 
-                response = requests.post(url, files=files, data=data, timeout=60)
+                response = self._session.post(
+                    url, files=files, data=data, timeout=60, stream=True
+                )
 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = self._parse_response(response)
                     if result.get("ok"):
                         self.logger.debug("文档发送成功")
                         return True
@@ -364,7 +441,7 @@ class TelegramNotifier:
                     self.logger.error(
                         f"文档发送失败，HTTP状态码: {response.status_code}"
                     )
-                    self.logger.debug(f"响应内容: {response.text}")
+                    self._log_error_body(response)
                     return False
 
         except requests.exceptions.Timeout:
@@ -476,10 +553,12 @@ class TelegramNotifier:
 
                 self.logger.debug(f"发送错误截图: {screenshot_path}")
 
-                response = requests.post(url, files=files, data=data, timeout=60)
+                response = self._session.post(
+                    url, files=files, data=data, timeout=60, stream=True
+                )
 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = self._parse_response(response)
                     if result.get("ok"):
                         self.logger.debug("错误截图发送成功")
                         return True
@@ -492,7 +571,7 @@ class TelegramNotifier:
                     self.logger.error(
                         f"错误截图发送失败，HTTP状态码: {response.status_code}"
                     )
-                    self.logger.debug(f"响应内容: {response.text}")
+                    self._log_error_body(response)
                     return False
 
         except requests.exceptions.Timeout:
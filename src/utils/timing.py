@@ -149,7 +149,10 @@ class TimingManager:
 
     @staticmethod
     def wait_for_page_ready(
-        driver, timeout: int = 10, logger: Optional[logging.Logger] = None
+        driver,
+        timeout: int = 10,
+        logger: Optional[logging.Logger] = None,
+        dom_ready_only: bool = False,
     ) -> bool:
         """
         等待页面完全加载就绪
@@ -158,6 +161,7 @@ class TimingManager:
             driver: WebDriver实例
             timeout: 超时时间
             logger: 日志器
+            dom_ready_only: 只等待DOM解析完成，不等待图片等子资源
 
         Returns:
             是否加载完成
@@ -166,8 +170,11 @@ class TimingManager:
             from selenium.webdriver.support.ui import WebDriverWait
 
             # 等待DOM加载完成
+            ready_states = (
+                ("interactive", "complete") if dom_ready_only else ("complete",)
+            )
             WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
+                lambda d: d.execute_script("return document.readyState") in ready_states
             )
 
             # 额外等待JavaScript执行完成